@@ -10,6 +10,8 @@ Features:
 - Find people at company by domain
 - Filter by title (Superintendent, Safety Director, COO)
 - Enrich with email, phone, LinkedIn
+- Concurrent async API calls with a shared rate limit
+- Cache API responses on disk between runs (requires diskcache)
 - Save to PostgreSQL or CSV
 
 Usage:
@@ -18,6 +20,9 @@ Usage:
     
     # Live mode (requires CLAY_API_KEY)
     python clay_enrichment.py --input districts.csv --output enriched_leads.csv
+    
+    # Ignore cached API responses and re-fetch everything
+    python clay_enrichment.py --input districts.csv --refresh
 
 Environment Variables:
     CLAY_API_KEY - Your Clay API key
@@ -27,22 +32,44 @@ Environment Variables:
 
 import os
 import json
-import time
+import asyncio
+import re
+import sys
 import argparse
 import logging
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 import csv
 
 # Optional imports
 try:
-    import requests
-    HAS_REQUESTS = True
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    from aiolimiter import AsyncLimiter
+    HAS_AIOLIMITER = True
+except ImportError:
+    HAS_AIOLIMITER = False
+
+try:
+    from diskcache import Cache
+    HAS_DISKCACHE = True
 except ImportError:
-    HAS_REQUESTS = False
+    HAS_DISKCACHE = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
     import psycopg2
+    from psycopg2.extras import execute_values
     HAS_POSTGRES = True
 except ImportError:
     HAS_POSTGRES = False
@@ -55,10 +82,18 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 CLAY_API_BASE = "https://api.clay.com/v1"
-RATE_LIMIT_DELAY = 1.0  # seconds between API calls
+RATE_LIMIT_RPS = 1.0  # max API calls per second (shared across all tasks)
+MAX_CONCURRENCY = 5  # max in-flight API calls
+BULK_ENRICH_SIZE = 50  # max people per bulk enrich request
+N_FIND_WORKERS = 3  # tasks searching for people at districts
+N_ENRICH_WORKERS = 2  # tasks enriching found people
+REQUEST_TIMEOUT = 30.0  # seconds per API call
+KEEPALIVE_TIMEOUT = 60.0  # seconds to keep idle connections open for reuse
+CACHE_DIR = "./.clay_cache"  # on-disk cache of API responses
+CACHE_TTL_DAYS = 30  # days before a cached response is re-fetched
 
 # Titles we're looking for
-TARGET_TITLES = [
+TARGET_TITLES = (
     "Superintendent",
     "Director of Safety",
     "Chief of Safety", 
@@ -68,7 +103,31 @@ TARGET_TITLES = [
     "Assistant Superintendent",
     "Chief of Police",
     "Director of Student Safety",
-]
+)
+
+# Output CSV columns, in order
+CSV_FIELDS = (
+    "district_name",
+    "domain",
+    "enrollment",
+    "full_name",
+    "first_name",
+    "last_name",
+    "title",
+    "email",
+    "phone",
+    "linkedin_url",
+    "persona",
+)
+
+# Persona classifier, checked in priority order (superintendent wins over
+# safety_director wins over coo) in a single compiled pattern
+_PERSONA_RE = re.compile(
+    r"(?=.*(?P<superintendent>superintendent))"
+    r"|(?=.*(?P<safety_director>safety|security|police))"
+    r"|(?=.*(?P<coo>\bcoo\b|operations))",
+    re.IGNORECASE | re.DOTALL,
+)
 
 # ============================================================================
 # DEMO DATA
@@ -257,22 +316,94 @@ DEMO_ENRICHED_LEADS = [
     }
 ]
 
+# Demo contacts indexed by domain for O(1) lookup
+_DEMO_BY_DOMAIN = {d["domain"]: d["contacts"] for d in DEMO_ENRICHED_LEADS}
+
 # ============================================================================
 # CLAY API CLIENT
 # ============================================================================
 
-class ClayClient:
-    """Client for Clay API interactions"""
+class AsyncClayClient:
+    """Async client for Clay API interactions
+
+    Use as an async context manager so the HTTP session is opened once and
+    shared by every call:
+
+        async with AsyncClayClient(api_key) as client:
+            people = await client.find_people("friscoisd.org")
     
-    def __init__(self, api_key: str):
+    If `cache` (a diskcache.Cache) is given, find_people and enrichment
+    responses are stored there for `cache_ttl` seconds and served locally on
+    later calls. `refresh=True` skips cache reads but still writes.
+    """
+    
+    def __init__(self, api_key: str, concurrency: int = MAX_CONCURRENCY, rps: float = RATE_LIMIT_RPS,
+                 cache=None, cache_ttl: float = CACHE_TTL_DAYS * 86400, refresh: bool = False):
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        })
+        self.concurrency = concurrency
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.refresh = refresh
+        self.bulk_available = True  # cleared after the bulk endpoint 404s
+        self.session = None
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # Below 1 rps, allow one call per 1/rps seconds instead
+        self.limiter = AsyncLimiter(rps, 1) if rps >= 1 else AsyncLimiter(1, 1 / rps)
+    
+    async def __aenter__(self):
+        # Pool sized to the concurrency cap so every in-flight call reuses a
+        # kept-alive connection instead of paying a fresh TCP/TLS handshake
+        self.session = aiohttp.ClientSession(
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=self.concurrency,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            ),
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+    
+    async def _post(self, endpoint: str, payload: Dict) -> Dict:
+        """POST to Clay, bounded by the concurrency cap and global rate limit"""
+        
+        async with self.semaphore, self.limiter:
+            async with self.session.post(endpoint, json=payload) as resp:
+                resp.raise_for_status()
+                if HAS_ORJSON:
+                    return orjson.loads(await resp.read())
+                return await resp.json()
+    
+    @staticmethod
+    def _cache_key(endpoint: str, payload: Dict) -> str:
+        return f"{endpoint}:{json.dumps(payload, sort_keys=True)}"
     
-    def find_people(self, domain: str, titles: List[str] = None) -> List[Dict]:
+    def _cache_get(self, endpoint: str, payload: Dict) -> Optional[Dict]:
+        if self.cache is None or self.refresh:
+            return None
+        return self.cache.get(self._cache_key(endpoint, payload))
+    
+    def _cache_set(self, endpoint: str, payload: Dict, data: Dict):
+        if self.cache is not None:
+            self.cache.set(self._cache_key(endpoint, payload), data, expire=self.cache_ttl)
+    
+    async def _cached_post(self, endpoint: str, payload: Dict) -> Dict:
+        """POST to Clay unless an unexpired response for the same request is cached"""
+        
+        data = self._cache_get(endpoint, payload)
+        if data is None:
+            data = await self._post(endpoint, payload)
+            self._cache_set(endpoint, payload, data)
+        return data
+    
+    async def find_people(self, domain: str, titles: Sequence[str] = None) -> List[Dict]:
         """Find people at a company by domain"""
         
         endpoint = f"{CLAY_API_BASE}/people/search"
@@ -284,48 +415,93 @@ class ClayClient:
         }
         
         try:
-            time.sleep(RATE_LIMIT_DELAY)
-            response = self.session.post(endpoint, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = await self._cached_post(endpoint, payload)
             return data.get("people", [])
             
         except Exception as e:
             logger.error(f"Error finding people at {domain}: {e}")
             return []
     
-    def enrich_person(self, person: Dict) -> Dict:
-        """Enrich a person with email, phone, LinkedIn"""
-        
-        endpoint = f"{CLAY_API_BASE}/people/enrich"
-        
-        payload = {
+    @staticmethod
+    def _enrich_payload(person: Dict) -> Dict:
+        """Build the enrich request body for a person"""
+        return {
             "first_name": person.get("first_name"),
             "last_name": person.get("last_name"),
             "company_domain": person.get("domain"),
             "title": person.get("title")
         }
+    
+    @staticmethod
+    def _merge_enrichment(person: Dict, data: Dict) -> Dict:
+        """Merge enrichment data into a person record"""
+        person["email"] = data.get("email")
+        person["phone"] = data.get("phone")
+        person["linkedin_url"] = data.get("linkedin_url")
+        return person
+    
+    async def enrich_person(self, person: Dict) -> Dict:
+        """Enrich a person with email, phone, LinkedIn"""
+        
+        endpoint = f"{CLAY_API_BASE}/people/enrich"
         
         try:
-            time.sleep(RATE_LIMIT_DELAY)
-            response = self.session.post(endpoint, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Merge enrichment data
-            person["email"] = data.get("email")
-            person["phone"] = data.get("phone")
-            person["linkedin_url"] = data.get("linkedin_url")
-            
-            return person
+            data = await self._cached_post(endpoint, self._enrich_payload(person))
+            return self._merge_enrichment(person, data)
             
         except Exception as e:
             logger.error(f"Error enriching {person.get('full_name')}: {e}")
             return person
     
-    def find_email(self, person: Dict) -> Optional[str]:
+    async def enrich_people_bulk(self, people: List[Dict]) -> List[Dict]:
+        """Enrich people in batches of BULK_ENRICH_SIZE, one request per batch
+        
+        Cached people are filled in locally and left out of the request. People
+        a bulk call fails on or leaves out fall back to concurrent enrich_person
+        calls, as does every batch once the bulk endpoint has returned 404.
+        Results are returned in the same order as `people`.
+        """
+        
+        endpoint = f"{CLAY_API_BASE}/people/enrich/bulk"
+        person_endpoint = f"{CLAY_API_BASE}/people/enrich"
+        
+        misses = []
+        for person in people:
+            data = self._cache_get(person_endpoint, self._enrich_payload(person))
+            if data is None:
+                misses.append(person)
+            else:
+                self._merge_enrichment(person, data)
+        
+        for start in range(0, len(misses), BULK_ENRICH_SIZE):
+            batch = misses[start:start + BULK_ENRICH_SIZE]
+            payloads = [self._enrich_payload(p) for p in batch]
+            
+            done = 0
+            if self.bulk_available:
+                try:
+                    data = await self._post(endpoint, {"people": payloads})
+                    results = data.get("people", [])
+                    for person, payload, result in zip(batch, payloads, results):
+                        self._cache_set(person_endpoint, payload, result)
+                        self._merge_enrichment(person, result)
+                        done += 1
+                    if done < len(batch):
+                        logger.warning(f"Bulk enrich returned {done} of {len(batch)} people, enriching the rest individually")
+                except aiohttp.ClientResponseError as e:
+                    if e.status == 404:
+                        self.bulk_available = False
+                        logger.warning("Bulk enrich endpoint not available, using per-person calls")
+                    else:
+                        logger.warning(f"Bulk enrich failed, falling back to per-person calls: {e}")
+                except Exception as e:
+                    logger.warning(f"Bulk enrich failed, falling back to per-person calls: {e}")
+            
+            await asyncio.gather(*[self.enrich_person(p) for p in batch[done:]])
+        
+        return people
+    
+    async def find_email(self, person: Dict) -> Optional[str]:
         """Find email for a person"""
         
         endpoint = f"{CLAY_API_BASE}/email/find"
@@ -337,11 +513,7 @@ class ClayClient:
         }
         
         try:
-            time.sleep(RATE_LIMIT_DELAY)
-            response = self.session.post(endpoint, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = await self._post(endpoint, payload)
             return data.get("email")
             
         except Exception as e:
@@ -356,18 +528,34 @@ class ClayClient:
 class EnrichmentPipeline:
     """Main enrichment pipeline"""
     
-    def __init__(self, api_key: str = None, demo_mode: bool = False):
+    def __init__(self, api_key: str = None, demo_mode: bool = False, rps: float = RATE_LIMIT_RPS,
+                 use_cache: bool = True, refresh_cache: bool = False, cache_ttl_days: float = CACHE_TTL_DAYS):
         self.demo_mode = demo_mode
         self.client = None
+        self.persona_counts = Counter()  # contacts per persona, updated as districts finish
         
         if not demo_mode:
             if not api_key:
                 raise ValueError("CLAY_API_KEY required for live mode")
-            if not HAS_REQUESTS:
-                raise ImportError("requests library required: pip install requests")
-            self.client = ClayClient(api_key)
+            if not (HAS_AIOHTTP and HAS_AIOLIMITER):
+                raise ImportError("aiohttp and aiolimiter required: pip install aiohttp aiolimiter")
+            
+            cache = None
+            if use_cache:
+                if HAS_DISKCACHE:
+                    cache = Cache(CACHE_DIR)
+                else:
+                    logger.warning("diskcache not installed, API responses will not be cached: pip install diskcache")
+            
+            self.client = AsyncClayClient(
+                api_key,
+                rps=rps,
+                cache=cache,
+                cache_ttl=cache_ttl_days * 86400,
+                refresh=refresh_cache,
+            )
     
-    def enrich_district(self, district: Dict) -> Dict:
+    async def enrich_district(self, district: Dict) -> Dict:
         """Enrich a single district with contacts"""
         
         domain = district.get("domain")
@@ -375,65 +563,140 @@ class EnrichmentPipeline:
             logger.warning(f"No domain for {district.get('district_name')}")
             return district
         
-        logger.info(f"Enriching {district.get('district_name')} ({domain})...")
+        logger.info("Enriching %s (%s)...", district.get("district_name"), domain)
         
         if self.demo_mode:
-            # Return demo data if available
-            for demo in DEMO_ENRICHED_LEADS:
-                if demo["domain"] == domain:
-                    district["contacts"] = demo["contacts"]
-                    return district
-            
-            # Generate placeholder if not in demo data
-            district["contacts"] = []
+            # Return demo data if available, empty placeholder otherwise
+            district["contacts"] = _DEMO_BY_DOMAIN.get(domain, [])
+            self._count_personas(district["contacts"])
             return district
         
         # Live API calls
-        people = self.client.find_people(domain)
+        people = await self.find_contacts(domain)
+        return await self.enrich_contacts(district, people)
+    
+    async def find_contacts(self, domain: str) -> List[Dict]:
+        """Find people at a district domain and classify their personas
+        
+        People whose title matches no target persona are dropped here, before
+        any enrich call is spent on them.
+        """
+        
+        people = await self.client.find_people(domain)
         
         contacts = []
         for person in people:
             # Classify persona based on title
-            title = person.get("title", "").lower()
-            if "superintendent" in title:
-                persona = "superintendent"
-            elif any(x in title for x in ["safety", "security", "police"]):
-                persona = "safety_director"
-            elif any(x in title for x in ["coo", "operations"]):
-                persona = "coo"
-            else:
-                persona = "other"
-            
-            # Enrich with contact info
-            enriched = self.client.enrich_person(person)
-            enriched["persona"] = persona
-            
-            contacts.append(enriched)
+            m = _PERSONA_RE.match(person.get("title") or "")
+            if m:
+                person["persona"] = sys.intern(m.lastgroup)
+                contacts.append(person)
+        
+        if len(contacts) < len(people):
+            logger.debug("Skipping %d non-target contacts at %s", len(people) - len(contacts), domain)
+        
+        return contacts
+    
+    async def enrich_contacts(self, district: Dict, people: List[Dict]) -> Dict:
+        """Enrich found people with contact info and attach them to the district"""
         
-        district["contacts"] = contacts
+        # One bulk request per batch
+        district["contacts"] = await self.client.enrich_people_bulk(people)
+        self._count_personas(district["contacts"])
         return district
     
-    def run(self, districts: List[Dict]) -> List[Dict]:
+    def _count_personas(self, contacts: List[Dict]):
+        self.persona_counts.update(c.get("persona") for c in contacts)
+    
+    async def _run_live(self, districts: List[Dict], on_done) -> None:
+        """Find -> enrich pipeline over asyncio queues
+        
+        Finder tasks push each district's people onto a queue that enricher
+        tasks drain, so enrichment of early districts overlaps the searches for
+        later ones instead of queueing behind all of them.
+        """
+        
+        n = len(districts)
+        find_q = asyncio.Queue()
+        enrich_q = asyncio.Queue(maxsize=N_ENRICH_WORKERS * 2)
+        for item in enumerate(districts):
+            find_q.put_nowait(item)
+        
+        async def find_worker():
+            while not find_q.empty():
+                i, district = find_q.get_nowait()
+                logger.info("[%d/%d] Processing %s...", i + 1, n, district.get("district_name"))
+                
+                domain = district.get("domain")
+                if not domain:
+                    logger.warning(f"No domain for {district.get('district_name')}")
+                    on_done()
+                    continue
+                
+                logger.info("Enriching %s (%s)...", district.get("district_name"), domain)
+                people = await self.find_contacts(domain)
+                await enrich_q.put((district, people))
+        
+        async def enrich_worker():
+            while True:
+                item = await enrich_q.get()
+                if item is None:
+                    return
+                await self.enrich_contacts(*item)
+                on_done()
+        
+        async def close_enrichers():
+            await asyncio.gather(*finders)
+            for _ in enrichers:
+                await enrich_q.put(None)
+        
+        enrichers = [asyncio.create_task(enrich_worker()) for _ in range(N_ENRICH_WORKERS)]
+        finders = [asyncio.create_task(find_worker()) for _ in range(N_FIND_WORKERS)]
+        tasks = [asyncio.create_task(close_enrichers()), *enrichers]
+        
+        # If any worker fails, cancel the rest and re-raise; otherwise finders
+        # would block forever on the full enrich queue once enrichers are gone
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in (*finders, *tasks):
+                task.cancel()
+            await asyncio.gather(*finders, *tasks, return_exceptions=True)
+            raise
+    
+    async def run(self, districts: List[Dict]) -> List[Dict]:
         """Run enrichment on all districts"""
         
-        logger.info(f"Starting enrichment for {len(districts)} districts...")
-        logger.info(f"Mode: {'DEMO' if self.demo_mode else 'LIVE'}")
+        n = len(districts)
+        logger.info("Starting enrichment for %d districts...", n)
+        logger.info("Mode: %s", "DEMO" if self.demo_mode else "LIVE")
         
-        enriched = []
-        for i, district in enumerate(districts):
-            logger.info(f"[{i+1}/{len(districts)}] Processing {district.get('district_name')}...")
-            
-            result = self.enrich_district(district)
-            enriched.append(result)
-            
+        self.persona_counts.clear()
+        completed = 0
+        
+        def on_done():
             # Progress update
-            if (i + 1) % 10 == 0:
-                logger.info(f"Progress: {i+1}/{len(districts)} districts enriched")
+            nonlocal completed
+            completed += 1
+            if completed % 10 == 0:
+                logger.info("Progress: %d/%d districts enriched", completed, n)
+        
+        if self.demo_mode:
+            for i, district in enumerate(districts):
+                logger.info("[%d/%d] Processing %s...", i + 1, n, district.get("district_name"))
+                await self.enrich_district(district)
+                on_done()
+        else:
+            async with self.client:
+                await self._run_live(districts, on_done)
+        
+        # Districts are enriched in place
+        enriched = list(districts)
         
         # Summary
-        total_contacts = sum(len(d.get("contacts", [])) for d in enriched)
-        superintendents = sum(1 for d in enriched for c in d.get("contacts", []) if c.get("persona") == "superintendent")
-        safety_directors = sum(1 for d in enriched for c in d.get("contacts", []) if c.get("persona") == "safety_director")
+        total_contacts = sum(self.persona_counts.values())
+        superintendents = self.persona_counts["superintendent"]
+        safety_directors = self.persona_counts["safety_director"]
         
         logger.info("=" * 50)
         logger.info("ENRICHMENT COMPLETE")
@@ -451,98 +714,140 @@ class EnrichmentPipeline:
 # ============================================================================
 
 def save_to_csv(enriched: List[Dict], output_path: str):
-    """Save enriched leads to CSV"""
+    """Save enriched leads to CSV, streaming one row per contact"""
     
-    rows = []
-    for district in enriched:
-        for contact in district.get("contacts", []):
-            rows.append({
-                "district_name": district.get("district_name"),
-                "domain": district.get("domain"),
-                "enrollment": district.get("enrollment"),
-                "full_name": contact.get("full_name"),
-                "first_name": contact.get("first_name"),
-                "last_name": contact.get("last_name"),
-                "title": contact.get("title"),
-                "email": contact.get("email"),
-                "phone": contact.get("phone"),
-                "linkedin_url": contact.get("linkedin_url"),
-                "persona": contact.get("persona"),
-            })
-    
-    if not rows:
+    if not any(district.get("contacts") for district in enriched):
         logger.warning("No contacts to save")
         return
     
+    count = 0
     with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for district in enriched:
+            district_name = district.get("district_name")
+            domain = district.get("domain")
+            enrollment = district.get("enrollment")
+            for contact in district.get("contacts", ()):
+                writer.writerow((
+                    district_name,
+                    domain,
+                    enrollment,
+                    contact.get("full_name"),
+                    contact.get("first_name"),
+                    contact.get("last_name"),
+                    contact.get("title"),
+                    contact.get("email"),
+                    contact.get("phone"),
+                    contact.get("linkedin_url"),
+                    contact.get("persona"),
+                ))
+                count += 1
     
-    logger.info(f"Saved {len(rows)} contacts to {output_path}")
+    logger.info(f"Saved {count} contacts to {output_path}")
 
 
 def save_to_json(enriched: List[Dict], output_path: str):
     """Save enriched leads to JSON"""
     
-    with open(output_path, "w") as f:
-        json.dump(enriched, f, indent=2)
+    if HAS_ORJSON:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(enriched, option=orjson.OPT_INDENT_2))
+    else:
+        # Same bytes as orjson: raw UTF-8 rather than \u escapes
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(enriched, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Saved to {output_path}")
 
 
 def save_to_postgres(enriched: List[Dict], database_url: str):
-    """Save enriched leads to PostgreSQL"""
+    """Save enriched leads to PostgreSQL
+    
+    Districts and leads are each upserted with a single batched statement.
+    Rows are deduplicated on their conflict key first, since Postgres rejects
+    an ON CONFLICT DO UPDATE that touches the same row twice in one command.
+    """
     
     if not HAS_POSTGRES:
         logger.error("psycopg2 required: pip install psycopg2-binary")
         return
     
+    # One row per domain (last wins); districts without a domain never conflict
+    district_rows = {}
+    undomained_rows = []
+    for district in enriched:
+        row = (district.get("district_name"), district.get("domain"), district.get("enrollment"))
+        if row[1]:
+            district_rows[row[1]] = row
+        else:
+            undomained_rows.append(row)
+    
     conn = psycopg2.connect(database_url)
-    cur = conn.cursor()
     
     try:
-        for district in enriched:
-            # Insert or update district
-            cur.execute("""
+        # One explicit transaction for the whole load: commits on success,
+        # rolls back on any error
+        with conn, conn.cursor() as cur:
+            # Don't wait for the WAL flush on commit; a crash can only lose
+            # this load, which is safe to re-run
+            cur.execute("SET LOCAL synchronous_commit = off")
+            
+            # Upsert districts
+            returned = execute_values(cur, """
                 INSERT INTO districts (district_name, domain, enrollment)
-                VALUES (%s, %s, %s)
+                VALUES %s
                 ON CONFLICT (domain) DO UPDATE SET
                     district_name = EXCLUDED.district_name,
                     enrollment = EXCLUDED.enrollment
-                RETURNING id
-            """, (district.get("district_name"), district.get("domain"), district.get("enrollment")))
+                RETURNING id, domain
+            """, list(district_rows.values()) + undomained_rows, page_size=1000, fetch=True)
             
-            district_id = cur.fetchone()[0]
+            district_ids = {domain: district_id for district_id, domain in returned if domain}
             
-            # Insert contacts
-            for contact in district.get("contacts", []):
-                cur.execute("""
-                    INSERT INTO leads (
-                        district_id, full_name, first_name, last_name,
-                        title, email, phone, linkedin_url, persona, enriched_at
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
-                    ON CONFLICT (email) DO UPDATE SET
-                        title = EXCLUDED.title,
-                        phone = EXCLUDED.phone,
-                        linkedin_url = EXCLUDED.linkedin_url
-                """, (
-                    district_id,
-                    contact.get("full_name"),
-                    contact.get("first_name"),
-                    contact.get("last_name"),
-                    contact.get("title"),
-                    contact.get("email"),
-                    contact.get("phone"),
-                    contact.get("linkedin_url"),
-                    contact.get("persona")
-                ))
+            # Flatten contacts, one row per email
+            lead_rows = {}
+            emailless_rows = []
+            for district in enriched:
+                district_id = district_ids.get(district.get("domain"))
+                for contact in district.get("contacts", []):
+                    row = (
+                        district_id,
+                        contact.get("full_name"),
+                        contact.get("first_name"),
+                        contact.get("last_name"),
+                        contact.get("title"),
+                        contact.get("email"),
+                        contact.get("phone"),
+                        contact.get("linkedin_url"),
+                        contact.get("persona")
+                    )
+                    if row[5]:
+                        prev = lead_rows.get(row[5])
+                        if prev:
+                            # Match row-by-row upserts: the first row is inserted and
+                            # later ones only update title, phone and linkedin_url
+                            row = prev[:4] + row[4:5] + prev[5:6] + row[6:8] + prev[8:]
+                        lead_rows[row[5]] = row
+                    else:
+                        emailless_rows.append(row)
+            
+            # Upsert leads
+            execute_values(cur, """
+                INSERT INTO leads (
+                    district_id, full_name, first_name, last_name,
+                    title, email, phone, linkedin_url, persona, enriched_at
+                ) VALUES %s
+                ON CONFLICT (email) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    phone = EXCLUDED.phone,
+                    linkedin_url = EXCLUDED.linkedin_url
+            """, list(lead_rows.values()) + emailless_rows,
+                template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())", page_size=1000)
         
-        conn.commit()
         logger.info(f"Saved {len(enriched)} districts to PostgreSQL")
         
     finally:
-        cur.close()
         conn.close()
 
 
@@ -554,19 +859,46 @@ def load_districts_from_csv(input_path: str) -> List[Dict]:
     """Load districts from CSV file"""
     
     districts = []
-    with open(input_path, "r") as f:
-        reader = csv.DictReader(f)
+    with open(input_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return districts
+        
+        # Column positions; missing columns point at a trailing None pad,
+        # so rows are cut to the header width first (like csv.DictReader,
+        # extra cells are never read as a named column)
+        idx = {name: i for i, name in enumerate(header)}
+        pad = len(header)
+        name_i = idx.get("district_name", pad)
+        alt_name_i = idx.get("name", pad)
+        domain_i = idx.get("domain", pad)
+        enrollment_i = idx.get("enrollment", pad)
+        city_i = idx.get("city", pad)
+        
         for row in reader:
+            if not row:
+                continue
+            row = row[:pad]
+            row += [None] * (pad + 1 - len(row))
             districts.append({
-                "district_name": row.get("district_name") or row.get("name"),
-                "domain": row.get("domain"),
-                "enrollment": int(row.get("enrollment", 0) or 0),
-                "city": row.get("city"),
+                "district_name": row[name_i] or row[alt_name_i],
+                "domain": row[domain_i],
+                "enrollment": int(row[enrollment_i] or 0),
+                "city": row[city_i],
             })
     
     return districts
 
 
+def positive_float(value: str) -> float:
+    """Parse --rps, rejecting zero and negative rates"""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="Clay API Enrichment Pipeline")
     parser.add_argument("--demo", action="store_true", help="Run in demo mode (no API calls)")
@@ -574,6 +906,10 @@ def main():
     parser.add_argument("--output", default="enriched_leads.csv", help="Output CSV file")
     parser.add_argument("--json", help="Also save to JSON file")
     parser.add_argument("--database", help="PostgreSQL connection URL")
+    parser.add_argument("--rps", type=positive_float, default=RATE_LIMIT_RPS, help="Max Clay API calls per second")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the API response cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached API responses and re-fetch")
+    parser.add_argument("--cache-ttl-days", type=float, default=CACHE_TTL_DAYS, help="Days to keep cached API responses")
     
     args = parser.parse_args()
     
@@ -594,8 +930,15 @@ def main():
         return
     
     # Run pipeline
-    pipeline = EnrichmentPipeline(api_key=api_key, demo_mode=args.demo)
-    enriched = pipeline.run(districts)
+    pipeline = EnrichmentPipeline(
+        api_key=api_key,
+        demo_mode=args.demo,
+        rps=args.rps,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        cache_ttl_days=args.cache_ttl_days,
+    )
+    enriched = asyncio.run(pipeline.run(districts))
     
     # Save outputs
     save_to_csv(enriched, args.output)
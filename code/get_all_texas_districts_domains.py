@@ -12,25 +12,82 @@ Data Sources:
 3. Wikipedia list of Texas school districts
 
 Usage:
-    pip install requests beautifulsoup4 pandas lxml
+    pip install requests aiohttp aiolimiter beautifulsoup4 pandas lxml
+    pip install selectolax  # optional, much faster HTML parsing
+    pip install diskcache  # optional, caches domain lookups between runs
+    pip install aiodns  # optional, async DNS for bulk domain checks
+    pip install orjson pyarrow  # optional, faster JSON / CSV output + Parquet
     python texas_districts_all.py
 
 Output:
     - texas_districts_all.csv (for Clay import)
     - texas_districts_all.json (full data)
+    - texas_districts_all.parquet (full data, typed; requires pyarrow)
 """
 
+import asyncio
+import io
+import socket
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import aiohttp
+from aiolimiter import AsyncLimiter
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
 import pandas as pd
 import json
 import re
 import os
-import time
+import string
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple
 import logging
 
+# Optional on-disk cache of domain lookups between runs
+try:
+    from diskcache import Cache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+# Optional async DNS resolver for bulk domain checks (falls back to threads)
+try:
+    import aiodns
+    HAS_AIODNS = True
+    # c-ares codes for a name with no address (vs. timeouts, SERVFAIL, ...)
+    _NO_ADDRESS_ARES = frozenset((
+        aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA,
+        aiodns.error.ARES_ENONAME, aiodns.error.ARES_EBADNAME,
+    ))
+except ImportError:
+    HAS_AIODNS = False
+
+# Optional fast serializers for the output files (fall back to json / pandas)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Optional fast HTML parser (falls back to BeautifulSoup + lxml)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -39,16 +96,83 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 OUTPUT_DIR = "./output"
-RATE_LIMIT = 0.5  # seconds between requests
+RATE_LIMIT_RPS = 2.0  # max requests per second per scraper (token bucket)
+MAX_CONCURRENCY = 10  # max in-flight page fetches
+ENRICH_CHUNK_SIZE = 50  # districts enriched per progress update
+DOMAIN_CONCURRENCY = 100  # domain HEAD probes in flight
+DOMAIN_WORKERS = 32  # districts whose domains are searched at once
+DOMAIN_PROBE_TIMEOUT = 3.0  # seconds per domain HEAD probe
+DOMAIN_CACHE_DIR = "./.domain_cache"  # on-disk cache of find_domain results
+DOMAIN_CACHE_TTL_DAYS = 30  # days before a district's domain is searched again
+PROBE_CACHE_TTL_DAYS = 7  # days a single URL's HEAD probe result is reused
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+# Patterns and CSS selectors used by the scrapers, compiled once
+_ENROLLMENT_RE = re.compile(r"([\d,]+)\s*students", re.I)
+_DISTRICT_NAME_RE = re.compile(r"ISD|CISD|Independent School District|Consolidated")
+_NCES_NAME_RE = re.compile(r"ISD|CISD|School")
+_WEBSITE_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+
+_DISTRICT_LINK_SEL = "a[href*='/districts/']"
+_WEBSITE_LINK_SEL = "a[href*='http'][target='_blank']"
+_LOCATION_SEL = ".location, [class*='location']"
+
+# ============================================================================
+# HTML PARSING
+# ============================================================================
+# Thin wrappers so scrapers work with either selectolax or BeautifulSoup nodes
+
+def parse_html(html: str):
+    """Parse an HTML document"""
+    if HAS_SELECTOLAX:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, "lxml")
+
+
+def select(tree, selector: str) -> list:
+    """All nodes matching a CSS selector"""
+    if HAS_SELECTOLAX:
+        return tree.css(selector)
+    return tree.select(selector)
+
+
+def select_one(tree, selector: str):
+    """First node matching a CSS selector, or None"""
+    if HAS_SELECTOLAX:
+        return tree.css_first(selector)
+    return tree.select_one(selector)
+
+
+def node_text(node, strip: bool = False) -> str:
+    """Text content of a node or document"""
+    if HAS_SELECTOLAX:
+        return node.text(strip=strip)
+    return node.get_text(strip=strip)
+
+
+def node_attr(node, name: str) -> str:
+    """Attribute value of a node, or "" if missing"""
+    if HAS_SELECTOLAX:
+        return node.attributes.get(name) or ""
+    return node.get(name, "")
+
+
 # ============================================================================
 # DATA SOURCES
 # ============================================================================
 
+def make_limiter(rps: float) -> AsyncLimiter:
+    """Rate limiter for `rps` requests/second, including fractional rates"""
+    # The bucket must hold at least one request, so sub-1 rates become one
+    # request per 1/rps seconds rather than a capacity that never fills
+    if rps >= 1:
+        return AsyncLimiter(rps, 1)
+    return AsyncLimiter(1, 1 / rps)
+
+
 class TexasTribuneScaper:
     """
     Scrapes Texas Tribune Schools Explorer
@@ -59,104 +183,128 @@ class TexasTribuneScaper:
     BASE_URL = "https://schools.texastribune.org"
     DISTRICTS_URL = "https://schools.texastribune.org/districts/"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+    def __init__(self, rps: float = RATE_LIMIT_RPS):
+        self.rps = rps
+    
+    async def _fetch(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                     limiter: AsyncLimiter, url: str, timeout: float) -> Optional[str]:
+        """Fetch a page's HTML, or None on a non-200 response"""
+        async with semaphore, limiter:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                if resp.status != 200:
+                    return None
+                return await resp.text()
     
-    def get_all_districts(self) -> List[Dict]:
-        """Get all Texas districts from Tribune"""
-        logger.info("Scraping Texas Tribune for all districts...")
+    async def _fetch_letter(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                            limiter: AsyncLimiter, letter: str) -> Optional[str]:
+        """Fetch the district index page for one letter"""
+        url = f"{self.DISTRICTS_URL}?letter={letter}"
+        logger.info(f"  Fetching districts starting with {letter}...")
+        
+        try:
+            return await self._fetch(session, semaphore, limiter, url, timeout=30)
+        except Exception as e:
+            logger.error(f"Error fetching letter {letter}: {e}")
+            return None
+    
+    def _parse_letter(self, letter: str, html: str, seen: set) -> List[Dict]:
+        """Parse one letter's index page, skipping names already in `seen`"""
         districts = []
         
-        # They paginate by letter A-Z
-        for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-            url = f"{self.DISTRICTS_URL}?letter={letter}"
-            logger.info(f"  Fetching districts starting with {letter}...")
+        try:
+            tree = parse_html(html)
             
-            try:
-                time.sleep(RATE_LIMIT)
-                resp = self.session.get(url, timeout=30)
-                if resp.status_code != 200:
+            # Find district links
+            links = select(tree, _DISTRICT_LINK_SEL)
+            
+            for link in links:
+                href = node_attr(link, "href")
+                name = node_text(link, strip=True)
+                
+                # Skip navigation links
+                if not name or name in ["Districts", "Schools", "?"]:
+                    continue
+                if "/districts/" not in href:
                     continue
-                    
-                soup = BeautifulSoup(resp.text, "lxml")
                 
-                # Find district links
-                links = soup.select("a[href*='/districts/']")
+                # Extract slug from URL
+                slug = href.split("/districts/")[-1].strip("/")
+                if not slug or slug == "":
+                    continue
                 
-                for link in links:
-                    href = link.get("href", "")
-                    name = link.get_text(strip=True)
-                    
-                    # Skip navigation links
-                    if not name or name in ["Districts", "Schools", "?"]:
-                        continue
-                    if "/districts/" not in href:
-                        continue
-                    
-                    # Extract slug from URL
-                    slug = href.split("/districts/")[-1].strip("/")
-                    if not slug or slug == "":
-                        continue
-                    
-                    districts.append({
-                        "name": name,
-                        "slug": slug,
-                        "tribune_url": f"{self.BASE_URL}{href}",
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error fetching letter {letter}: {e}")
-        
-        # Deduplicate
-        seen = set()
-        unique = []
-        for d in districts:
-            if d["name"] not in seen:
-                seen.add(d["name"])
-                unique.append(d)
+                # Deduplicate
+                if name in seen:
+                    continue
+                seen.add(name)
+                
+                districts.append({
+                    "name": name,
+                    "slug": slug,
+                    "tribune_url": f"{self.BASE_URL}{href}",
+                })
+                
+        except Exception as e:
+            logger.error(f"Error parsing letter {letter}: {e}")
         
-        logger.info(f"Found {len(unique)} districts from Tribune")
-        return unique
+        return districts
     
-    def enrich_district(self, district: Dict) -> Dict:
+    async def iter_letters(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                           limiter: AsyncLimiter, seen: set):
+        """Yield (letter, new districts) for each index page, A-Z"""
+        tasks = [
+            asyncio.create_task(self._fetch_letter(session, semaphore, limiter, letter))
+            for letter in string.ascii_uppercase
+        ]
+        # Pages are fetched concurrently but parsed in A-Z order, so which
+        # copy of a repeated name is kept doesn't depend on arrival order
+        try:
+            for letter, task in zip(string.ascii_uppercase, tasks):
+                html = await task
+                if html is not None:
+                    yield letter, self._parse_letter(letter, html, seen)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def enrich_district(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                              limiter: AsyncLimiter, district: Dict) -> Dict:
         """Get additional details from district page"""
         url = district.get("tribune_url", "")
         if not url:
             return district
         
         try:
-            time.sleep(RATE_LIMIT)
-            resp = self.session.get(url, timeout=15)
-            if resp.status_code != 200:
+            html = await self._fetch(session, semaphore, limiter, url, timeout=15)
+            if html is None:
                 return district
             
-            soup = BeautifulSoup(resp.text, "lxml")
-            text = soup.get_text()
+            tree = parse_html(html)
+            text = node_text(tree)
             
             # Find enrollment
-            enrollment_match = re.search(r"([\d,]+)\s*students", text, re.I)
+            enrollment_match = _ENROLLMENT_RE.search(text)
             if enrollment_match:
                 district["enrollment"] = int(enrollment_match.group(1).replace(",", ""))
             
             # Find website link
-            website_link = soup.select_one("a[href*='http'][target='_blank']")
+            website_link = select_one(tree, _WEBSITE_LINK_SEL)
             if website_link:
-                href = website_link.get("href", "")
+                href = node_attr(website_link, "href")
                 if "texastribune" not in href and "facebook" not in href:
                     district["website"] = href
             
             # Find location
-            location_elem = soup.select_one(".location, [class*='location']")
+            location_elem = select_one(tree, _LOCATION_SEL)
             if location_elem:
-                district["city"] = location_elem.get_text(strip=True)
+                # Many districts share a city; keep one copy of each name
+                district["city"] = sys.intern(node_text(location_elem, strip=True))
                 
         except Exception as e:
             logger.debug(f"Error enriching {district['name']}: {e}")
         
         return district
-
-
+    
 class NCESscraper:
     """
     Scrapes NCES (National Center for Education Statistics)
@@ -183,7 +331,6 @@ class NCESscraper:
         districts = []
         
         try:
-            time.sleep(RATE_LIMIT)
             resp = self.session.get(self.SEARCH_URL, params=params, timeout=30)
             soup = BeautifulSoup(resp.text, "lxml")
             
@@ -196,7 +343,7 @@ class NCESscraper:
                     name = cells[0].get_text(strip=True)
                     city = cells[1].get_text(strip=True) if len(cells) > 1 else ""
                     
-                    if name and "ISD" in name or "CISD" in name or "School" in name:
+                    if name and _NCES_NAME_RE.search(name):
                         districts.append({
                             "name": name,
                             "city": city,
@@ -220,61 +367,245 @@ class WikipediaScraper:
         "https://en.wikipedia.org/wiki/List_of_school_districts_in_Texas",
     ]
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+    def __init__(self, rps: float = RATE_LIMIT_RPS):
+        self.rps = rps
     
-    def get_districts(self) -> List[Dict]:
+    async def _fetch_page(self, session: aiohttp.ClientSession, limiter: AsyncLimiter,
+                          url: str) -> Optional[bytes]:
+        """Fetch a list page's raw HTML, or None on error"""
+        try:
+            async with limiter:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                    return await resp.read()
+        except Exception as e:
+            logger.error(f"Error fetching Wikipedia: {e}")
+            return None
+    
+    @staticmethod
+    def _iter_wiki_links(content: bytes):
+        """Yield (text, href) for each /wiki/ link, streaming the page
+        
+        The parsed tree is pruned behind each link, so it holds only the
+        branch currently being parsed instead of growing with the page.
+        """
+        for _, link in etree.iterparse(io.BytesIO(content), events=("end",), tag="a", html=True):
+            href = link.get("href", "")
+            if "/wiki/" in href:
+                yield "".join(t.strip() for t in link.itertext()), href
+            link.clear(keep_tail=True)
+            
+            # Everything before this link, at every level, is already parsed
+            node = link
+            while node.getparent() is not None:
+                parent = node.getparent()
+                while node.getprevious() is not None:
+                    del parent[0]
+                node = parent
+    
+    async def get_districts(self) -> List[Dict]:
         """Get districts from Wikipedia"""
         logger.info("Scraping Wikipedia for Texas districts...")
         districts = []
+        seen = set()
         
-        for url in self.URLS:
+        limiter = make_limiter(self.rps)
+        async with aiohttp.ClientSession(headers=HEADERS) as session:
+            pages = await asyncio.gather(*[self._fetch_page(session, limiter, url) for url in self.URLS])
+        
+        for content in pages:
+            if content is None:
+                continue
+            
             try:
-                time.sleep(RATE_LIMIT)
-                resp = self.session.get(url, timeout=30)
-                soup = BeautifulSoup(resp.text, "lxml")
-                
                 # Find all links that look like school districts
-                links = soup.select("a[href*='/wiki/']")
-                
-                for link in links:
-                    text = link.get_text(strip=True)
-                    
+                for text, href in self._iter_wiki_links(content):
                     # Filter for school district names
-                    if any(x in text for x in ["ISD", "CISD", "Independent School District", "Consolidated"]):
+                    if _DISTRICT_NAME_RE.search(text):
                         # Skip disambiguation pages
-                        if "disambiguation" in link.get("href", "").lower():
+                        if "disambiguation" in href.lower():
+                            continue
+                        
+                        # Deduplicate
+                        if text in seen:
                             continue
-                            
+                        seen.add(text)
+                        
                         districts.append({
                             "name": text,
-                            "wikipedia_url": "https://en.wikipedia.org" + link.get("href", ""),
+                            "wikipedia_url": "https://en.wikipedia.org" + href,
                             "source": "Wikipedia"
                         })
                         
             except Exception as e:
-                logger.error(f"Error fetching Wikipedia: {e}")
-        
-        # Deduplicate
-        seen = set()
-        unique = []
-        for d in districts:
-            name = d["name"]
-            if name not in seen:
-                seen.add(name)
-                unique.append(d)
+                logger.error(f"Error parsing Wikipedia: {e}")
         
-        logger.info(f"Found {len(unique)} districts from Wikipedia")
-        return unique
+        logger.info(f"Found {len(districts)} districts from Wikipedia")
+        return districts
+
+
+# ============================================================================
+# DOMAIN PROBES
+# ============================================================================
+
+# Lookup failures that mean the name really has no address, as opposed to a
+# resolver timeout or SERVFAIL that may succeed on the next run
+_NO_ADDRESS_EAI = frozenset(
+    code for code in (getattr(socket, "EAI_NONAME", None), getattr(socket, "EAI_NODATA", None))
+    if code is not None
+)
+
+
+def _resolves(host: str) -> Optional[bool]:
+    """True if host has an address record, False if it has none, None if the
+    lookup failed without an answer; far cheaper than a HEAD probe"""
+    try:
+        socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+        return True
+    except UnicodeError:
+        # Empty label or a label over 63 characters
+        return False
+    except socket.gaierror as e:
+        return False if e.errno in _NO_ADDRESS_EAI else None
+
+
+@lru_cache(maxsize=8192)
+def _probe_host(domain: str) -> str:
+    """Host a domain candidate is probed on ("x.org" -> "www.x.org")"""
+    return domain if domain.startswith("www.") else f"www.{domain}"
+
+
+@lru_cache(maxsize=8192)
+def _to_url(domain: str) -> str:
+    """URL a domain candidate is probed at"""
+    return f"https://{_probe_host(domain)}"
 
 
 # ============================================================================
 # DOMAIN FINDER
 # ============================================================================
 
+# Known domain mappings (verified), read-only
+KNOWN_DOMAINS = MappingProxyType({
+    "Frisco ISD": "friscoisd.org",
+    "Leander ISD": "leanderisd.org",
+    "Round Rock ISD": "roundrockisd.org",
+    "Keller ISD": "kellerisd.net",
+    "Humble ISD": "humbleisd.net",
+    "Prosper ISD": "prosper-isd.net",
+    "Georgetown ISD": "georgetownisd.org",
+    "Hays CISD": "hayscisd.net",
+    "Aledo ISD": "aledoisd.org",
+    "Dripping Springs ISD": "dsisdtx.us",
+    "Lake Travis ISD": "ltisdschools.org",
+    "Boerne ISD": "boerneisd.net",
+    "Plano ISD": "pisd.edu",
+    "McKinney ISD": "mckinneyisd.net",
+    "Allen ISD": "allenisd.org",
+    "Denton ISD": "dentonisd.org",
+    "Northwest ISD": "nisdtx.org",
+    "Mansfield ISD": "mansfieldisd.org",
+    "Coppell ISD": "coppellisd.com",
+    "Southlake Carroll ISD": "southlakecarroll.edu",
+    "Grapevine-Colleyville ISD": "gcisd.net",
+    "Highland Park ISD": "hpisd.org",
+    "Eanes ISD": "eanesisd.net",
+    "Wylie ISD": "wylieisd.net",
+    "Lovejoy ISD": "lovejoyisd.com",
+    "Rockwall ISD": "rockwallisd.com",
+    "Midlothian ISD": "misd.gs",
+    "Forney ISD": "forneyisd.net",
+    "Little Elm ISD": "leisd.net",
+    "Comal ISD": "comalisd.org",
+    "Conroe ISD": "conroeisd.net",
+    "Cypress-Fairbanks ISD": "cfisd.net",
+    "Spring Branch ISD": "springbranchisd.com",
+    "Klein ISD": "kleinisd.net",
+    "Tomball ISD": "tomballisd.net",
+    "Pearland ISD": "pearlandisd.org",
+    "Clear Creek ISD": "ccisd.net",
+    "Fort Bend ISD": "fortbendisd.com",
+    "Katy ISD": "katyisd.org",
+    "Lamar CISD": "lcisd.org",
+    "Pasadena ISD": "pasadenaisd.org",
+    "Spring ISD": "springisd.org",
+    "Aldine ISD": "aldineisd.org",
+    "Houston ISD": "houstonisd.org",
+    "Dallas ISD": "dallasisd.org",
+    "Fort Worth ISD": "fwisd.org",
+    "Austin ISD": "austinisd.org",
+    "San Antonio ISD": "saisd.net",
+    "Arlington ISD": "aisd.net",
+    "Garland ISD": "garlandisd.net",
+    "Irving ISD": "irvingisd.net",
+    "Mesquite ISD": "mesquiteisd.org",
+    "Richardson ISD": "risd.org",
+    "Carrollton-Farmers Branch ISD": "cfbisd.edu",
+    "Lewisville ISD": "lisd.net",
+    "Birdville ISD": "birdvilleschools.net",
+    "Crowley ISD": "crowleyisdtx.org",
+    "Eagle Mountain-Saginaw ISD": "emsisd.com",
+    "Hurst-Euless-Bedford ISD": "hebisd.edu",
+    "Waxahachie ISD": "wisd.org",
+    "Weatherford ISD": "weatherfordisd.com",
+    "Burleson ISD": "burleson.k12.tx.us",
+    "Joshua ISD": "joshuaisd.org",
+    "Cleburne ISD": "c-isd.com",
+    "Granbury ISD": "granburyisd.org",
+    "New Braunfels ISD": "nbisd.org",
+    "Schertz-Cibolo-Universal City ISD": "scuc.txed.net",
+    "Judson ISD": "judsonisd.org",
+    "North East ISD": "neisd.net",
+    "Northside ISD": "nisd.net",
+    "San Marcos CISD": "smcisd.net",
+    "Pflugerville ISD": "pfisd.net",
+    "Manor ISD": "manorisd.net",
+    "Del Valle ISD": "dvisd.net",
+    "Cedar Park": "leanderisd.org",  # Part of Leander
+    "Bastrop ISD": "bfrisk.org",
+    "Lockhart ISD": "lockhartisd.org",
+    "Seguin ISD": "seguinisd.net",
+    "Killeen ISD": "killeenisd.org",
+    "Temple ISD": "tisd.org",
+    "Belton ISD": "bisd.net",
+    "Waco ISD": "wacoisd.org",
+    "Midway ISD": "midwayisd.org",
+    "Bryan ISD": "bryanisd.org",
+    "College Station ISD": "csisd.org",
+    "Tyler ISD": "tylerisd.org",
+    "Longview ISD": "lisd.org",
+    "Nacogdoches ISD": "nacisd.org",
+    "Lufkin ISD": "lufkinisd.org",
+    "Texarkana ISD": "txkisd.net",
+    "Amarillo ISD": "amaisd.org",
+    "Lubbock ISD": "lubbockisd.org",
+    "Midland ISD": "midlandisd.net",
+    "Odessa": "ectorcountyisd.org",
+    "Ector County ISD": "ectorcountyisd.org",
+    "El Paso ISD": "episd.org",
+    "Socorro ISD": "sisd.net",
+    "Ysleta ISD": "yisd.net",
+    "Corpus Christi ISD": "ccisd.us",
+    "Flour Bluff ISD": "flourbluffschools.net",
+    "Calallen ISD": "calallen.org",
+    "Laredo ISD": "laredoisd.org",
+    "United ISD": "uisd.net",
+    "McAllen ISD": "mcallenisd.org",
+    "Edinburg CISD": "ecisd.us",
+    "Pharr-San Juan-Alamo ISD": "psjaisd.us",
+    "Brownsville ISD": "bisd.us",
+    "Harlingen CISD": "hcisd.org",
+})
+
+
 class DomainFinder:
-    """Finds website domains for school districts"""
+    """Finds website domains for school districts
+
+    If `cache` (a diskcache.Cache) is given, found domains are stored there
+    for `cache_ttl` seconds so later runs skip the HEAD probe cascade, and
+    each probed URL's result is kept for `probe_ttl` seconds when DNS or HTTP
+    gave a definite answer. Misses are not cached per district, so a new site
+    is picked up once its probes expire.
+    """
     
     # Common domain patterns for Texas ISDs
     DOMAIN_PATTERNS = [
@@ -287,158 +618,183 @@ class DomainFinder:
         "{slug}schools.net",
     ]
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+    # Deletes every ASCII character that can't appear in a slug
+    _SLUG_DELETE = str.maketrans("", "", "".join(
+        c for c in map(chr, range(128)) if c not in string.ascii_lowercase + string.digits
+    ))
+    
+    def __init__(self, cache=None, cache_ttl: float = DOMAIN_CACHE_TTL_DAYS * 86400,
+                 probe_ttl: float = PROBE_CACHE_TTL_DAYS * 86400):
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.probe_ttl = probe_ttl
+        self._resolver = None
+        self._dns_tasks = {}
+        self._dns_trusted = False
+    
+    @staticmethod
+    def _known_domain(district_name: str) -> str:
+        """Look up a verified domain by exact name, then by normalized slug"""
+        return (KNOWN_DOMAINS.get(district_name)
+                or _KNOWN_BY_SLUG.get(DomainFinder._make_slug(district_name), ""))
+    
+    def _cache_get(self, key: str):
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+    
+    def _cache_set(self, key: str, value, expire: float):
+        if self.cache is not None:
+            self.cache.set(key, value, expire=expire)
+    
+    @asynccontextmanager
+    async def probe_session(self):
+        """Shared HEAD-probe session, semaphore and DNS state for a batch of lookups"""
+        connector = aiohttp.TCPConnector(limit=DOMAIN_CONCURRENCY, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=DOMAIN_PROBE_TIMEOUT)
+        # Probes wait on the semaphore rather than the connector so time spent
+        # queued does not count against the per-probe timeout
+        semaphore = asyncio.Semaphore(DOMAIN_CONCURRENCY)
         
-        # Known domain mappings (verified)
-        self.known_domains = {
-            "Frisco ISD": "friscoisd.org",
-            "Leander ISD": "leanderisd.org",
-            "Round Rock ISD": "roundrockisd.org",
-            "Keller ISD": "kellerisd.net",
-            "Humble ISD": "humbleisd.net",
-            "Prosper ISD": "prosper-isd.net",
-            "Georgetown ISD": "georgetownisd.org",
-            "Hays CISD": "hayscisd.net",
-            "Aledo ISD": "aledoisd.org",
-            "Dripping Springs ISD": "dsisdtx.us",
-            "Lake Travis ISD": "ltisdschools.org",
-            "Boerne ISD": "boerneisd.net",
-            "Plano ISD": "pisd.edu",
-            "McKinney ISD": "mckinneyisd.net",
-            "Allen ISD": "allenisd.org",
-            "Denton ISD": "dentonisd.org",
-            "Northwest ISD": "nisdtx.org",
-            "Mansfield ISD": "mansfieldisd.org",
-            "Coppell ISD": "coppellisd.com",
-            "Southlake Carroll ISD": "southlakecarroll.edu",
-            "Grapevine-Colleyville ISD": "gcisd.net",
-            "Highland Park ISD": "hpisd.org",
-            "Eanes ISD": "eanesisd.net",
-            "Wylie ISD": "wylieisd.net",
-            "Lovejoy ISD": "lovejoyisd.com",
-            "Rockwall ISD": "rockwallisd.com",
-            "Midlothian ISD": "misd.gs",
-            "Forney ISD": "forneyisd.net",
-            "Little Elm ISD": "leisd.net",
-            "Comal ISD": "comalisd.org",
-            "Conroe ISD": "conroeisd.net",
-            "Cypress-Fairbanks ISD": "cfisd.net",
-            "Spring Branch ISD": "springbranchisd.com",
-            "Klein ISD": "kleinisd.net",
-            "Tomball ISD": "tomballisd.net",
-            "Pearland ISD": "pearlandisd.org",
-            "Clear Creek ISD": "ccisd.net",
-            "Fort Bend ISD": "fortbendisd.com",
-            "Katy ISD": "katyisd.org",
-            "Lamar CISD": "lcisd.org",
-            "Pasadena ISD": "pasadenaisd.org",
-            "Spring ISD": "springisd.org",
-            "Aldine ISD": "aldineisd.org",
-            "Houston ISD": "houstonisd.org",
-            "Dallas ISD": "dallasisd.org",
-            "Fort Worth ISD": "fwisd.org",
-            "Austin ISD": "austinisd.org",
-            "San Antonio ISD": "saisd.net",
-            "Arlington ISD": "aisd.net",
-            "Garland ISD": "garlandisd.net",
-            "Irving ISD": "irvingisd.net",
-            "Mesquite ISD": "mesquiteisd.org",
-            "Richardson ISD": "risd.org",
-            "Carrollton-Farmers Branch ISD": "cfbisd.edu",
-            "Lewisville ISD": "lisd.net",
-            "Birdville ISD": "birdvilleschools.net",
-            "Crowley ISD": "crowleyisdtx.org",
-            "Eagle Mountain-Saginaw ISD": "emsisd.com",
-            "Hurst-Euless-Bedford ISD": "hebisd.edu",
-            "Northwest ISD": "nisdtx.org",
-            "Waxahachie ISD": "wisd.org",
-            "Weatherford ISD": "weatherfordisd.com",
-            "Burleson ISD": "burleson.k12.tx.us",
-            "Joshua ISD": "joshuaisd.org",
-            "Cleburne ISD": "c-isd.com",
-            "Granbury ISD": "granburyisd.org",
-            "New Braunfels ISD": "nbisd.org",
-            "Schertz-Cibolo-Universal City ISD": "scuc.txed.net",
-            "Judson ISD": "judsonisd.org",
-            "North East ISD": "neisd.net",
-            "Northside ISD": "nisd.net",
-            "San Marcos CISD": "smcisd.net",
-            "Pflugerville ISD": "pfisd.net",
-            "Manor ISD": "manorisd.net",
-            "Del Valle ISD": "dvisd.net",
-            "Cedar Park": "leanderisd.org",  # Part of Leander
-            "Bastrop ISD": "bfrisk.org",
-            "Lockhart ISD": "lockhartisd.org",
-            "Seguin ISD": "seguinisd.net",
-            "Killeen ISD": "killeenisd.org",
-            "Temple ISD": "tisd.org",
-            "Belton ISD": "bisd.net",
-            "Waco ISD": "wacoisd.org",
-            "Midway ISD": "midwayisd.org",
-            "Bryan ISD": "bryanisd.org",
-            "College Station ISD": "csisd.org",
-            "Tyler ISD": "tylerisd.org",
-            "Longview ISD": "lisd.org",
-            "Nacogdoches ISD": "nacisd.org",
-            "Lufkin ISD": "lufkinisd.org",
-            "Texarkana ISD": "txkisd.net",
-            "Amarillo ISD": "amaisd.org",
-            "Lubbock ISD": "lubbockisd.org",
-            "Midland ISD": "midlandisd.net",
-            "Odessa": "ectorcountyisd.org",
-            "Ector County ISD": "ectorcountyisd.org",
-            "El Paso ISD": "episd.org",
-            "Socorro ISD": "sisd.net",
-            "Ysleta ISD": "yisd.net",
-            "Corpus Christi ISD": "ccisd.us",
-            "Flour Bluff ISD": "flourbluffschools.net",
-            "Calallen ISD": "calallen.org",
-            "Laredo ISD": "laredoisd.org",
-            "United ISD": "uisd.net",
-            "McAllen ISD": "mcallenisd.org",
-            "Edinburg CISD": "ecisd.us",
-            "Pharr-San Juan-Alamo ISD": "psjaisd.us",
-            "Brownsville ISD": "bisd.us",
-            "Harlingen CISD": "hcisd.org",
-        }
+        self._resolver = aiodns.DNSResolver() if HAS_AIODNS else None
+        self._dns_tasks = {}
+        
+        # A resolver that can't find a known district (offline, or one that
+        # answers NXDOMAIN for everything) makes every miss look definite
+        canary = _probe_host(next(iter(KNOWN_DOMAINS.values())))
+        self._dns_trusted = bool(await self._lookup_host(canary))
+        if not self._dns_trusted:
+            logger.warning(f"DNS lookup of {canary} failed, domain misses won't be cached this run")
+        
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+            yield session, semaphore
     
-    def find_domain(self, district_name: str) -> str:
-        """Find domain for a district"""
+    async def find_domain(self, session: aiohttp.ClientSession,
+                          semaphore: asyncio.Semaphore, district_name: str) -> str:
+        """Find domain for a district, probing all patterns at once"""
+        known = self._known_domain(district_name)
+        if known:
+            return known
         
-        # Check known domains first
-        if district_name in self.known_domains:
-            return self.known_domains[district_name]
+        # Only hits are cached; "" left by older runs re-probes instead
+        cached = self._cache_get(f"domain:{district_name}")
+        if cached:
+            return cached
         
-        # Try to construct domain from name
         slug = self._make_slug(district_name)
-        
-        for pattern in self.DOMAIN_PATTERNS:
+        # "x.org" and "www.x.org" probe the same URL; keep the first of each
+        by_url = {}
+        for pattern in _PATTERN_PRIORITY:
             domain = pattern.format(slug=slug)
-            if self._check_domain(domain):
-                return domain
+            by_url.setdefault(_to_url(domain), domain)
+        domains = list(by_url.values())
         
-        return ""
+        # Pattern order is still the priority: the first pattern that responds
+        # wins and the probes still in flight are cancelled
+        tasks = [
+            asyncio.create_task(self._check_domain_async(session, semaphore, domain))
+            for domain in domains
+        ]
+        try:
+            for domain, task in zip(domains, tasks):
+                if await task:
+                    self._cache_set(f"domain:{district_name}", domain, self.cache_ttl)
+                    return domain
+            return ""
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
-    def _make_slug(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _make_slug(name: str) -> str:
         """Convert district name to URL slug"""
         # "Frisco ISD" -> "friscoisd"
-        slug = name.lower()
-        slug = slug.replace(" independent school district", "isd")
+        slug = " ".join(name.lower().split())
         slug = slug.replace(" consolidated independent school district", "cisd")
-        slug = slug.replace(" ", "")
-        slug = re.sub(r"[^a-z0-9]", "", slug)
-        return slug
+        slug = slug.replace(" independent school district", "isd")
+        # Strip spaces/punctuation in one pass, then anything non-ASCII
+        slug = slug.translate(DomainFinder._SLUG_DELETE)
+        return slug.encode("ascii", "ignore").decode()
+    
+    async def _check_domain_async(self, session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore, domain: str) -> bool:
+        """Check if domain exists (DNS lookup, then quick HEAD request) on the event loop"""
+        url = _to_url(domain)
+        cached = self._cache_get(f"probe:{url}")
+        if cached is not None:
+            return cached
+        
+        ok, definitive = await self._probe(session, semaphore, url, _probe_host(domain))
+        # Timeouts and resolver/connection errors are retried on the next run
+        # rather than hiding the domain for the whole probe TTL
+        if definitive:
+            self._cache_set(f"probe:{url}", ok, self.probe_ttl)
+        else:
+            logger.debug(f"Probe of {url} failed without an answer, not caching")
+        return ok
     
-    def _check_domain(self, domain: str) -> bool:
-        """Check if domain exists (quick HEAD request)"""
+    async def _probe(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                     url: str, host: str) -> Tuple[bool, bool]:
+        """(ok, definitive) for one URL; definitive only if DNS or HTTP answered"""
+        resolves = await self._resolves_async(host)
+        if not resolves:
+            return False, resolves is False and self._dns_trusted
+        
+        async with semaphore:
+            try:
+                async with session.head(url, allow_redirects=True) as resp:
+                    return resp.status < 400, True
+            except ValueError:
+                # Malformed URL, so it will never answer
+                return False, True
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                return False, False
+    
+    async def _resolves_async(self, host: str) -> Optional[bool]:
+        """DNS check shared by every probe of the same host in a bulk run"""
+        task = self._dns_tasks.get(host)
+        if task is None:
+            task = self._dns_tasks[host] = asyncio.ensure_future(self._lookup_host(host))
+        # Shielded so a cancelled probe doesn't cancel the lookup for the others
+        return await asyncio.shield(task)
+    
+    async def _lookup_host(self, host: str) -> Optional[bool]:
+        if self._resolver is None:
+            return await asyncio.get_running_loop().run_in_executor(None, _resolves, host)
         try:
-            url = f"https://www.{domain}" if not domain.startswith("www.") else f"https://{domain}"
-            resp = self.session.head(url, timeout=3, allow_redirects=True)
-            return resp.status_code < 400
-        except:
-            return False
+            await self._resolver.getaddrinfo(host, port=443)
+            return True
+        except aiodns.error.DNSError as e:
+            code = e.args[0] if e.args else None
+            return False if code in _NO_ADDRESS_ARES else None
+
+
+# Known domains keyed by slug, so variants like "frisco isd " or
+# "Frisco Independent School District" still hit the table
+_KNOWN_BY_SLUG = MappingProxyType({DomainFinder._make_slug(k): v for k, v in KNOWN_DOMAINS.items()})
+
+
+def _pattern_priority(patterns: List[str]) -> tuple:
+    """Order patterns by how often they match KNOWN_DOMAINS exactly, then by
+    how common their TLD is there, so the likeliest probe is tried first"""
+    tlds = Counter(domain.rsplit(".", 1)[-1] for domain in KNOWN_DOMAINS.values())
+    hits = Counter(
+        pattern
+        for name, domain in KNOWN_DOMAINS.items()
+        for pattern in patterns
+        if pattern.format(slug=DomainFinder._make_slug(name)) == domain
+    )
+    # "www." patterns probe the same URL as their bare form, so they go last;
+    # sorted() is stable, so ties keep the order they are declared in
+    return tuple(sorted(
+        patterns,
+        key=lambda p: (p.startswith("www."), -hits[p], -tlds[p.rsplit(".", 1)[-1]]),
+    ))
+
+
+_PATTERN_PRIORITY = _pattern_priority(DomainFinder.DOMAIN_PATTERNS)
 
 
 # ============================================================================
@@ -448,10 +804,19 @@ class DomainFinder:
 class TexasDistrictScraper:
     """Main orchestrator to get all Texas districts"""
     
-    def __init__(self):
-        self.tribune = TexasTribuneScaper()
-        self.wikipedia = WikipediaScraper()
-        self.domain_finder = DomainFinder()
+    def __init__(self, rps: float = RATE_LIMIT_RPS, use_cache: bool = True, refresh_domains: bool = False):
+        self.tribune = TexasTribuneScaper(rps)
+        self.wikipedia = WikipediaScraper(rps)
+        
+        cache = None
+        if use_cache:
+            if HAS_DISKCACHE:
+                cache = Cache(DOMAIN_CACHE_DIR)
+                if refresh_domains:
+                    cache.clear()
+            else:
+                logger.warning("diskcache not installed, domain lookups will not be cached: pip install diskcache")
+        self.domain_finder = DomainFinder(cache=cache)
     
     def run(self, enrich_all: bool = False) -> List[Dict]:
         """Run full scraping pipeline"""
@@ -460,83 +825,139 @@ class TexasDistrictScraper:
         logger.info("Texas School District Scraper - ALL DISTRICTS")
         logger.info("=" * 60)
         
-        all_districts = {}
+        districts = asyncio.run(self._scrape_pipeline(enrich_all))
         
-        # Source 1: Texas Tribune
-        try:
-            tribune_districts = self.tribune.get_all_districts()
-            for d in tribune_districts:
-                name = d["name"]
-                if name not in all_districts:
-                    all_districts[name] = d
-                else:
-                    all_districts[name].update(d)
-        except Exception as e:
-            logger.error(f"Tribune scraping failed: {e}")
+        # Clean up and standardize (one shared timestamp string for the run)
+        scraped_at = datetime.now().isoformat()
+        for d in districts:
+            d["state"] = "TX"
+            d["scraped_at"] = scraped_at
+            if "enrollment" not in d:
+                d["enrollment"] = 0
         
-        # Source 2: Wikipedia (backup)
-        try:
-            wiki_districts = self.wikipedia.get_districts()
-            for d in wiki_districts:
-                name = d["name"]
-                if name not in all_districts:
-                    all_districts[name] = d
-        except Exception as e:
-            logger.error(f"Wikipedia scraping failed: {e}")
+        # Sort by enrollment (known first)
+        districts.sort(key=lambda x: x.get("enrollment", 0), reverse=True)
         
-        # Convert to list
-        districts = list(all_districts.values())
+        return districts
+    
+    async def _scrape_pipeline(self, enrich_all: bool) -> List[Dict]:
+        """Scrape -> find domains -> enrich over asyncio queues
+        
+        Each Tribune letter page is handed to the domain finders as soon as it
+        is parsed, and each district moves on to enrichment as soon as its
+        domain is known, so the stages overlap instead of running back to back.
+        """
+        domain_q = asyncio.Queue()
+        enrich_q = asyncio.Queue()
+        by_letter = {}
+        wiki_districts = []
+        seen = set()
+        enriched = 0
         
-        logger.info(f"\nTotal unique districts: {len(districts)}")
+        # Source 2: Wikipedia (backup) is fetched alongside Tribune
+        wiki_task = asyncio.create_task(self.wikipedia.get_districts())
         
-        # Find domains
-        logger.info("\nFinding website domains...")
-        for i, d in enumerate(districts):
-            if i % 50 == 0:
-                logger.info(f"  Processing {i}/{len(districts)}...")
+        async def produce(session, semaphore, limiter):
+            # Source 1: Texas Tribune, one letter page at a time as pages arrive
+            logger.info("Scraping Texas Tribune for all districts...")
+            try:
+                async for letter, districts in self.tribune.iter_letters(session, semaphore, limiter, seen):
+                    by_letter[letter] = districts
+                    for d in districts:
+                        domain_q.put_nowait(d)
+            except Exception as e:
+                logger.error(f"Tribune scraping failed: {e}")
+            logger.info(f"Found {len(seen)} districts from Tribune")
             
-            # Skip if already has website
-            if d.get("website"):
-                # Extract domain from URL
-                match = re.search(r"https?://(?:www\.)?([^/]+)", d["website"])
-                if match:
-                    d["domain"] = match.group(1)
-                continue
+            # Wikipedia only adds names Tribune didn't have
+            try:
+                for d in await wiki_task:
+                    if d["name"] not in seen:
+                        seen.add(d["name"])
+                        wiki_districts.append(d)
+                        domain_q.put_nowait(d)
+            except Exception as e:
+                logger.error(f"Wikipedia scraping failed: {e}")
             
-            # Find domain
-            domain = self.domain_finder.find_domain(d["name"])
-            if domain:
-                d["domain"] = domain
-                d["website"] = f"https://www.{domain}"
+            logger.info(f"\nTotal unique districts: {len(seen)}")
+            logger.info("\nFinding website domains...")
+        
+        async def find_worker(probe_session, probe_semaphore):
+            while True:
+                d = await domain_q.get()
+                if d is None:
+                    return
+                
+                try:
+                    # Skip if already has website
+                    if d.get("website"):
+                        # Extract domain from URL
+                        match = _WEBSITE_RE.search(d["website"])
+                        if match:
+                            d["domain"] = match.group(1)
+                    else:
+                        domain = await self.domain_finder.find_domain(probe_session, probe_semaphore, d["name"])
+                        if domain:
+                            d["domain"] = domain
+                            d["website"] = f"https://www.{domain}"
+                except Exception as e:
+                    # One bad lookup must not take the worker (and the run) down
+                    logger.warning(f"Domain lookup failed for {d['name']}: {e}")
+                
+                if enrich_all:
+                    enrich_q.put_nowait(d)
+        
+        async def enrich_worker(session, semaphore, limiter):
+            nonlocal enriched
+            while True:
+                d = await enrich_q.get()
+                if d is None:
+                    return
+                await self.tribune.enrich_district(session, semaphore, limiter, d)
+                enriched += 1
+                if enriched % ENRICH_CHUNK_SIZE == 0:
+                    logger.info(f"  Enriched {enriched}/{len(seen)}...")
         
-        # Enrich with Tribune data if requested
         if enrich_all:
-            logger.info("\nEnriching with detailed data (this will take a while)...")
-            for i, d in enumerate(districts):
-                if i % 20 == 0:
-                    logger.info(f"  Enriching {i}/{len(districts)}...")
-                if d.get("tribune_url"):
-                    districts[i] = self.tribune.enrich_district(d)
-        
-        # Clean up and standardize
-        for d in districts:
-            d["state"] = "TX"
-            d["scraped_at"] = datetime.now().isoformat()
-            if "enrollment" not in d:
-                d["enrollment"] = 0
+            logger.info("Enriching with detailed data as domains are found...")
         
-        # Sort by enrollment (known first)
-        districts.sort(key=lambda x: x.get("enrollment", 0), reverse=True)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        limiter = make_limiter(self.tribune.rps)
+        async with aiohttp.ClientSession(headers=HEADERS) as session, \
+                self.domain_finder.probe_session() as (probe_session, probe_semaphore):
+            enrichers = [
+                asyncio.create_task(enrich_worker(session, semaphore, limiter))
+                for _ in range(MAX_CONCURRENCY if enrich_all else 0)
+            ]
+            finders = [
+                asyncio.create_task(find_worker(probe_session, probe_semaphore))
+                for _ in range(DOMAIN_WORKERS)
+            ]
+            
+            await produce(session, semaphore, limiter)
+            for _ in finders:
+                domain_q.put_nowait(None)
+            await asyncio.gather(*finders)
+            for _ in enrichers:
+                enrich_q.put_nowait(None)
+            await asyncio.gather(*enrichers)
         
-        return districts
+        # Keep the serial order: Tribune letters A-Z, then Wikipedia additions
+        tribune_districts = [d for letter in string.ascii_uppercase for d in by_letter.get(letter, [])]
+        return tribune_districts + wiki_districts
     
     def save_outputs(self, districts: List[Dict]):
-        """Save to CSV and JSON"""
+        """Save to CSV, JSON and (with pyarrow) Parquet"""
         os.makedirs(OUTPUT_DIR, exist_ok=True)
         
         # JSON (full data)
-        with open(f"{OUTPUT_DIR}/texas_districts_all.json", "w") as f:
-            json.dump(districts, f, indent=2)
+        if HAS_ORJSON:
+            with open(f"{OUTPUT_DIR}/texas_districts_all.json", "wb") as f:
+                f.write(orjson.dumps(districts, option=orjson.OPT_INDENT_2))
+        else:
+            # Same bytes as orjson: raw UTF-8 rather than \u escapes
+            with open(f"{OUTPUT_DIR}/texas_districts_all.json", "w", encoding="utf-8") as f:
+                json.dump(districts, f, indent=2, ensure_ascii=False)
         
         # CSV for Clay import
         df = pd.DataFrame(districts)
@@ -547,30 +968,53 @@ class TexasDistrictScraper:
         other_cols = [c for c in df.columns if c not in cols]
         df = df[cols + other_cols]
         
-        df.to_csv(f"{OUTPUT_DIR}/texas_districts_all.csv", index=False)
-        
         # Also save Clay-optimized version (just essential columns)
         clay_cols = ["name", "domain", "website", "city", "enrollment"]
         clay_cols = [c for c in clay_cols if c in df.columns]
-        df_clay = df[clay_cols]
-        df_clay.to_csv(f"{OUTPUT_DIR}/texas_districts_for_clay.csv", index=False)
+        
+        if HAS_PYARROW:
+            # Build the Arrow table once and write both files from it
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, f"{OUTPUT_DIR}/texas_districts_all.csv")
+            pacsv.write_csv(table.select(clay_cols), f"{OUTPUT_DIR}/texas_districts_for_clay.csv")
+            
+            # Typed, compressed copy for downstream loaders; CSVs stay for Clay
+            dtypes = {"enrollment": "int32", "state": "category"}
+            typed = df.astype({c: t for c, t in dtypes.items() if c in df.columns})
+            pq.write_table(
+                pa.Table.from_pandas(typed, preserve_index=False),
+                f"{OUTPUT_DIR}/texas_districts_all.parquet",
+                compression="zstd",
+            )
+        else:
+            df.to_csv(f"{OUTPUT_DIR}/texas_districts_all.csv", index=False)
+            df[clay_cols].to_csv(f"{OUTPUT_DIR}/texas_districts_for_clay.csv", index=False)
         
         logger.info(f"\nSaved to {OUTPUT_DIR}/")
         logger.info(f"  - texas_districts_all.json ({len(districts)} districts)")
         logger.info(f"  - texas_districts_all.csv")
         logger.info(f"  - texas_districts_for_clay.csv (Clay import ready)")
+        if HAS_PYARROW:
+            logger.info(f"  - texas_districts_all.parquet")
     
     def print_summary(self, districts: List[Dict]):
         """Print summary stats"""
-        total = len(districts)
-        with_domain = len([d for d in districts if d.get("domain")])
-        with_enrollment = len([d for d in districts if d.get("enrollment", 0) > 0])
+        # One DataFrame pass instead of a list scan per statistic
+        df = pd.DataFrame(districts, columns=["name", "domain", "enrollment"])
+        enrollment = df["enrollment"].fillna(0).astype(int)
         
-        # Size buckets
-        small = len([d for d in districts if 0 < d.get("enrollment", 0) < 5000])
-        medium = len([d for d in districts if 5000 <= d.get("enrollment", 0) < 20000])
-        large = len([d for d in districts if 20000 <= d.get("enrollment", 0) < 50000])
-        xlarge = len([d for d in districts if d.get("enrollment", 0) >= 50000])
+        total = len(df)
+        with_domain = int(df["domain"].fillna("").astype(bool).sum())
+        with_enrollment = int((enrollment > 0).sum())
+        
+        # Size buckets (districts with no enrollment fall outside every bucket)
+        buckets = pd.cut(
+            enrollment,
+            bins=[1, 5000, 20000, 50000, float("inf")],
+            right=False,
+            labels=["small", "medium", "large", "xlarge"],
+        ).value_counts()
+        small, medium, large, xlarge = (int(buckets[b]) for b in ["small", "medium", "large", "xlarge"])
         
         print("\n" + "=" * 60)
         print("SUMMARY")
@@ -591,31 +1035,43 @@ class TexasDistrictScraper:
         print(f"{'Enrollment':<12} {'District':<35} {'Domain':<25}")
         print("-" * 72)
         
-        sorted_districts = sorted(districts, key=lambda x: x.get("enrollment", 0), reverse=True)
-        for d in sorted_districts[:20]:
-            enrollment = d.get("enrollment", 0)
-            name = d.get("name", "")[:33]
-            domain = d.get("domain", "")[:23]
-            print(f"{enrollment:<12,} {name:<35} {domain:<25}")
+        df["enrollment"] = enrollment
+        top = df.nlargest(20, "enrollment").fillna("")
+        for name, domain, enrollment in zip(top["name"], top["domain"], top["enrollment"]):
+            print(f"{int(enrollment):<12,} {str(name)[:33]:<35} {str(domain)[:23]:<25}")
 
 
 # ============================================================================
 # CLI
 # ============================================================================
 
+def positive_float(value: str) -> float:
+    """argparse type for rates that must be above zero"""
+    import argparse
+    
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="Scrape ALL Texas school districts")
     parser.add_argument("--enrich", action="store_true", help="Enrich with detailed data (slow)")
     parser.add_argument("--output", default="./output", help="Output directory")
+    parser.add_argument("--rps", type=positive_float, default=RATE_LIMIT_RPS, help="Max requests per second to each source")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the domain lookup cache")
+    parser.add_argument("--refresh-domains", action="store_true", help="Clear cached domain lookups and probe again")
     
     args = parser.parse_args()
     
     global OUTPUT_DIR
     OUTPUT_DIR = args.output
     
-    scraper = TexasDistrictScraper()
+    scraper = TexasDistrictScraper(rps=args.rps, use_cache=not args.no_cache,
+                                   refresh_domains=args.refresh_domains)
     districts = scraper.run(enrich_all=args.enrich)
     scraper.save_outputs(districts)
     scraper.print_summary(districts)
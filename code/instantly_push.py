@@ -20,6 +20,7 @@ Usage:
 
 Environment Variables:
     INSTANTLY_API_KEY - Your Instantly.ai API key
+    INSTANTLY_RPS - Max API requests per second for your plan (default 2)
     DATABASE_URL - PostgreSQL connection string (optional)
 
 """
@@ -30,15 +31,26 @@ import time
 import argparse
 import logging
 import csv
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -47,7 +59,10 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 INSTANTLY_API_BASE = "https://api.instantly.ai/api/v1"
-RATE_LIMIT_DELAY = 0.5  # seconds between API calls
+INSTANTLY_RPS = 2.0  # default max API requests per second ($INSTANTLY_RPS or --rps overrides)
+BULK_PUSH_SIZE = 100  # leads sent per lead/add request
+PUSH_WORKERS = 8  # lead/add requests in flight
+MAX_RETRIES = 3  # retries on 429 / 5xx, with exponential backoff
 
 # Campaign IDs (you would set these after creating campaigns in Instantly)
 CAMPAIGNS = {
@@ -163,31 +178,73 @@ DEMO_LEADS = [
 # INSTANTLY API CLIENT
 # ============================================================================
 
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second
+    
+    Threads only wait for their own token, so concurrent callers share the
+    rate instead of each sleeping a fixed delay.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class InstantlyClient:
     """Client for Instantly.ai API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, rps: float = INSTANTLY_RPS):
         self.api_key = api_key
         self.session = requests.Session()
+        self.session.params = {"api_key": api_key}
+        self.session.headers["Connection"] = "keep-alive"
+        
+        # Pool sized for the push workers; retry throttled and failed calls
+        retry = Retry(
+            total=MAX_RETRIES,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=0.5,
+            allowed_methods=frozenset(["GET", "POST"]),
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.limiter = TokenBucket(rps)
     
     def _make_request(self, method: str, endpoint: str, data: Dict = None) -> Dict:
         """Make API request"""
         
         url = f"{INSTANTLY_API_BASE}/{endpoint}"
-        params = {"api_key": self.api_key}
         
         try:
-            time.sleep(RATE_LIMIT_DELAY)
+            self.limiter.acquire()
             
             if method == "GET":
-                response = self.session.get(url, params=params)
+                response = self.session.get(url)
             elif method == "POST":
-                response = self.session.post(url, params=params, json=data)
+                response = self.session.post(url, json=data)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content) if HAS_ORJSON else response.json()
             
         except Exception as e:
             logger.error(f"API Error: {e}")
@@ -250,7 +307,7 @@ class InstantlyClient:
 class InstantlyPushPipeline:
     """Pipeline to push leads to Instantly.ai"""
     
-    def __init__(self, api_key: str = None, demo_mode: bool = False):
+    def __init__(self, api_key: str = None, demo_mode: bool = False, rps: float = INSTANTLY_RPS):
         self.demo_mode = demo_mode
         self.client = None
         self.push_log = []
@@ -260,20 +317,13 @@ class InstantlyPushPipeline:
                 raise ValueError("INSTANTLY_API_KEY required for live mode")
             if not HAS_REQUESTS:
                 raise ImportError("requests library required: pip install requests")
-            self.client = InstantlyClient(api_key)
+            self.client = InstantlyClient(api_key, rps=rps)
     
     def push_lead(self, lead: Dict, campaign_id: str) -> Dict:
         """Push a single lead to Instantly"""
         
         if self.demo_mode:
-            # Simulate successful push
-            result = {
-                "success": True,
-                "email": lead["email"],
-                "campaign_id": campaign_id,
-                "instantly_lead_id": f"demo_lead_{lead['email'].split('@')[0]}",
-                "status": "added"
-            }
+            result = self._demo_result(lead, campaign_id)
             self.push_log.append(result)
             return result
         
@@ -289,41 +339,103 @@ class InstantlyPushPipeline:
         self.push_log.append(result)
         return result
     
-    def run(self, leads: List[Dict], campaign_mapping: Dict[str, str] = None) -> Dict:
-        """Run push pipeline for all leads"""
+    def push_leads(self, leads: List[Dict], campaign_id: str) -> List[Dict]:
+        """Push a batch of leads to one campaign in a single request
+        
+        Safe to call from worker threads; the caller records the results in
+        push_log.
+        """
+        
+        if self.demo_mode:
+            return [self._demo_result(lead, campaign_id) for lead in leads]
+        
+        # Live API call
+        response = self.client.add_leads_bulk(campaign_id, leads)
+        success = "error" not in response
+        
+        return [
+            {
+                "success": success,
+                "email": lead["email"],
+                "campaign_id": campaign_id,
+                "response": response
+            }
+            for lead in leads
+        ]
+    
+    @staticmethod
+    def _demo_result(lead: Dict, campaign_id: str) -> Dict:
+        """Simulate successful push"""
+        return {
+            "success": True,
+            "email": lead["email"],
+            "campaign_id": campaign_id,
+            "instantly_lead_id": f"demo_lead_{lead['email'].split('@')[0]}",
+            "status": "added"
+        }
+    
+    def run(self, leads: Iterable[Dict], campaign_mapping: Dict[str, str] = None) -> Dict:
+        """Run push pipeline for all leads (any iterable, consumed once)"""
         
         if campaign_mapping is None:
             campaign_mapping = CAMPAIGNS
         
-        logger.info(f"Starting push for {len(leads)} leads...")
+        logger.info("Starting push...")
         logger.info(f"Mode: {'DEMO' if self.demo_mode else 'LIVE'}")
         
         results = {
-            "total": len(leads),
+            "total": 0,
             "success": 0,
             "failed": 0,
             "by_campaign": {}
         }
         
-        for i, lead in enumerate(leads):
-            persona = lead.get("persona", "superintendent")
-            campaign_id = campaign_mapping.get(persona)
-            
-            if not campaign_id:
-                logger.warning(f"No campaign for persona: {persona}")
-                results["failed"] += 1
-                continue
+        def record(campaign_id: str, chunk: List[Dict], batch_results: List[Dict]):
+            logger.info(f"Pushed {len(chunk)} leads to {campaign_id}")
+            self.push_log.extend(batch_results)
             
-            logger.info(f"[{i+1}/{len(leads)}] Pushing {lead['email']} to {persona} campaign...")
+            for result in batch_results:
+                if result["success"]:
+                    results["success"] += 1
+                    results["by_campaign"][campaign_id] = results["by_campaign"].get(campaign_id, 0) + 1
+                else:
+                    results["failed"] += 1
+                    logger.error(f"Failed to push {result['email']}: {result}")
+        
+        # Leads are buffered per campaign and each full batch is sent as soon
+        # as it fills, so pushing starts while the input is still being read.
+        # Batches are recorded in submission order to keep the log deterministic,
+        # and at most 2 * PUSH_WORKERS are held in memory at once.
+        buffers = defaultdict(list)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=PUSH_WORKERS) as pool:
+            def flush(campaign_id: str):
+                chunk = buffers.pop(campaign_id)
+                pending.append((campaign_id, chunk, pool.submit(self.push_leads, chunk, campaign_id)))
+                while pending and (pending[0][2].done() or len(pending) > 2 * PUSH_WORKERS):
+                    campaign_id, chunk, future = pending.popleft()
+                    record(campaign_id, chunk, future.result())
             
-            result = self.push_lead(lead, campaign_id)
+            for lead in leads:
+                results["total"] += 1
+                persona = lead.get("persona", "superintendent")
+                campaign_id = campaign_mapping.get(persona)
+                
+                if not campaign_id:
+                    logger.warning(f"No campaign for persona: {persona}")
+                    results["failed"] += 1
+                    continue
+                
+                buffers[campaign_id].append(lead)
+                if len(buffers[campaign_id]) >= BULK_PUSH_SIZE:
+                    flush(campaign_id)
             
-            if result["success"]:
-                results["success"] += 1
-                results["by_campaign"][campaign_id] = results["by_campaign"].get(campaign_id, 0) + 1
-            else:
-                results["failed"] += 1
-                logger.error(f"Failed to push {lead['email']}: {result}")
+            for campaign_id in list(buffers):
+                flush(campaign_id)
+            while pending:
+                campaign_id, chunk, future = pending.popleft()
+                record(campaign_id, chunk, future.result())
         
         # Summary
         logger.info("=" * 50)
@@ -343,18 +455,17 @@ class InstantlyPushPipeline:
 # CLI HELPERS
 # ============================================================================
 
-def load_leads_from_csv(input_path: str) -> List[Dict]:
-    """Load leads from enriched CSV"""
+def load_leads_from_csv(input_path: str) -> Iterator[Dict]:
+    """Stream leads from enriched CSV, one row at a time"""
     
-    leads = []
-    with open(input_path, "r") as f:
+    with open(input_path, "r", newline="") as f:
         reader = csv.DictReader(f)
         for row in reader:
             # Skip rows without email
             if not row.get("email"):
                 continue
             
-            leads.append({
+            yield {
                 "email": row["email"],
                 "first_name": row.get("first_name", ""),
                 "last_name": row.get("last_name", ""),
@@ -366,16 +477,19 @@ def load_leads_from_csv(input_path: str) -> List[Dict]:
                     "city": row.get("city", ""),
                     "district_name": row.get("district_name", ""),
                 }
-            })
-    
-    return leads
+            }
 
 
 def save_push_log(log: List[Dict], output_path: str):
     """Save push log to JSON"""
     
-    with open(output_path, "w") as f:
-        json.dump(log, f, indent=2)
+    if HAS_ORJSON:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(log, option=orjson.OPT_INDENT_2))
+    else:
+        # Same bytes as orjson: raw UTF-8 rather than \u escapes
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(log, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Push log saved to {output_path}")
 
@@ -434,12 +548,21 @@ def generate_demo_output():
 # MAIN
 # ============================================================================
 
+def positive_float(value: str) -> float:
+    """--rps value; TokenBucket needs a rate above zero"""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="Push leads to Instantly.ai")
     parser.add_argument("--demo", action="store_true", help="Run in demo mode")
     parser.add_argument("--input", help="Input CSV with enriched leads")
     parser.add_argument("--campaign", help="Campaign ID (overrides persona mapping)")
     parser.add_argument("--log", default="push_log.json", help="Output log file")
+    parser.add_argument("--rps", type=positive_float, default=os.environ.get("INSTANTLY_RPS") or INSTANTLY_RPS, help="Max API requests per second (default: $INSTANTLY_RPS or 2)")
     
     args = parser.parse_args()
     
@@ -470,7 +593,7 @@ def main():
         }
     
     # Run pipeline
-    pipeline = InstantlyPushPipeline(api_key=api_key)
+    pipeline = InstantlyPushPipeline(api_key=api_key, rps=args.rps)
     results = pipeline.run(leads, campaign_mapping)
     
     # Save log